@@ -0,0 +1,210 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+import numba
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import requests
+import streamlit as st
+
+NAMES_URL = 'https://www.ssa.gov/oact/babynames/names.zip'
+CACHE_DIR = Path('~/.cache').expanduser()
+ZIP_CACHE = CACHE_DIR / 'ssa_names.zip'
+ETAG_CACHE = CACHE_DIR / 'ssa_names.zip.etag'
+LAST_MODIFIED_CACHE = CACHE_DIR / 'ssa_names.zip.last-modified'
+CHECKSUM_CACHE = CACHE_DIR / 'ssa_names.zip.sha256'
+# Bump whenever the processed frame's columns or dtypes change so old Parquet files are ignored
+PROCESSED_FORMAT = 2
+
+# Streamlit runs each session's script on its own thread; Numba's workqueue threading layer
+# doesn't support concurrent parallel launches, so serialize them
+_KERNEL_LOCK = threading.Lock()
+# Caps the (chunks x names) int64 accumulator at a few MB regardless of core count
+MAX_KERNEL_CHUNKS = 8
+
+# yobYYYY.txt files have no header: name,sex,count
+CSV_READ_OPTIONS = pacsv.ReadOptions(column_names=['name', 'sex', 'count'])
+CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(column_types={
+    'name': pa.string(),
+    'sex': pa.dictionary(pa.int32(), pa.string()),
+    'count': pa.int32(),
+})
+
+## LOAD DATA DIRECTLY FROM SSA WEBSITE
+def fetch_names_zip():
+    """Return a local copy of names.zip, re-downloading only when SSA reports it changed."""
+    headers = {}
+    if ZIP_CACHE.exists():
+        if ETAG_CACHE.exists():
+            headers['If-None-Match'] = ETAG_CACHE.read_text().strip()
+        if LAST_MODIFIED_CACHE.exists():
+            headers['If-Modified-Since'] = LAST_MODIFIED_CACHE.read_text().strip()
+    try:
+        response = requests.get(NAMES_URL, headers=headers, stream=True, timeout=30)
+    except requests.RequestException:
+        # Offline: fall back to whatever we downloaded last time
+        if ZIP_CACHE.exists():
+            return ZIP_CACHE
+        raise
+    with response:
+        if response.status_code == 304:
+            return ZIP_CACHE
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # SSA outage or block: keep serving the last good download if there is one
+            if ZIP_CACHE.exists():
+                return ZIP_CACHE
+            raise
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so a half-finished download never replaces a good cache
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.part')
+        try:
+            response.raw.decode_content = True
+            with os.fdopen(fd, 'wb') as out:
+                shutil.copyfileobj(response.raw, out, length=1 << 20)
+            checksum = _file_sha256(tmp_path)
+            # Clear the old checksum first so nothing pairs it with the new zip
+            CHECKSUM_CACHE.unlink(missing_ok=True)
+            os.replace(tmp_path, ZIP_CACHE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        validators = {ETAG_CACHE: response.headers.get('ETag'),
+                      LAST_MODIFIED_CACHE: response.headers.get('Last-Modified')}
+    CHECKSUM_CACHE.write_text(checksum)
+    for sidecar, value in validators.items():
+        if value:
+            sidecar.write_text(value)
+        else:
+            sidecar.unlink(missing_ok=True)
+    return ZIP_CACHE
+
+def _file_sha256(path):
+    """Hex SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def zip_checksum():
+    """SHA-256 of the cached zip, taken from the sidecar written at download time."""
+    if CHECKSUM_CACHE.exists():
+        return CHECKSUM_CACHE.read_text().strip()
+    # Zip cached before checksums were recorded: hash it once and remember
+    checksum = _file_sha256(ZIP_CACHE)
+    CHECKSUM_CACHE.write_text(checksum)
+    return checksum
+
+def _parse_one(file):
+    """Parse one yobYYYY.txt blob into an Arrow table with a year column."""
+    blob, year = file
+    tbl = pacsv.read_csv(pa.py_buffer(blob), read_options=CSV_READ_OPTIONS, convert_options=CSV_CONVERT_OPTIONS)
+    return tbl.append_column('year', pa.array(np.full(len(tbl), year, dtype=np.int16)))
+
+def processed_cache_path():
+    """Parquet path for the processed frame, keyed on the zip's checksum and PROCESSED_FORMAT."""
+    return CACHE_DIR / f'ssa_processed-v{PROCESSED_FORMAT}-{zip_checksum()[:16]}.parquet'
+
+@st.cache_resource
+def load_name_data():
+    # Always revalidate the zip (a 304 when unchanged), then reuse the frame processed from it
+    zip_path = fetch_names_zip()
+    parquet_path = processed_cache_path()
+    if parquet_path.exists():
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow', memory_map=True)
+        except (pa.ArrowInvalid, OSError):
+            pass  # Corrupt or truncated cache file: rebuild it below
+    with zipfile.ZipFile(zip_path) as z:
+        # Get all text files inside the zip (each represents a year).
+        # ZipFile isn't safe for concurrent reads, so decompress here and only parse in the pool.
+        files = [(z.read(file), int(file[3:7])) for file in z.namelist() if file.endswith('.txt')]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        tables = list(ex.map(_parse_one, files))
+    data = pa.concat_tables(tables).to_pandas()
+    # Births per (year, sex) as a small year x sex table, only broadcast to compute prop
+    totals = data.groupby(['year', 'sex'], observed=True)['count'].sum().unstack(fill_value=0)
+    year_idx = totals.index.get_indexer(data['year'])
+    sex_idx = totals.columns.get_indexer(data['sex'])
+    data['prop'] = (data['count'].to_numpy() / totals.to_numpy()[year_idx, sex_idx]).astype(np.float32)
+    # Shrink the cached frame: categoricals for the string columns, narrow ints/floats elsewhere
+    data['name'] = data['name'].astype('category')
+    data['sex'] = data['sex'].astype('category')
+    data['year'] = data['year'].astype(np.int16)
+    data['count'] = data['count'].astype(np.int32)
+    # Keep rows ordered by year so a year range is a contiguous slice
+    data = data.sort_values('year', kind='stable', ignore_index=True)
+    # Unique temp file per writer so concurrent cold starts can't interleave into one file
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            data.to_parquet(out, engine='pyarrow', compression='zstd', row_group_size=1 << 20)
+        os.replace(tmp_path, parquet_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # Drop frames built from older downloads or formats
+    for stale in CACHE_DIR.glob('ssa_processed*.parquet'):
+        if stale != parquet_path:
+            stale.unlink(missing_ok=True)
+    return data
+
+def year_bounds(data, y0, y1):
+    """Row positions [lo, hi) covering years y0..y1 in the year-sorted frame."""
+    years = data['year'].to_numpy()
+    return np.searchsorted(years, y0, side='left'), np.searchsorted(years, y1, side='right')
+
+@numba.njit(parallel=True, cache=True)
+def sum_by_name(codes, weights, n_names, n_chunks):
+    """Grouped sum of weights by name code, one private accumulator row per chunk."""
+    partial = np.zeros((n_chunks, n_names), np.int64)
+    step = (codes.size + n_chunks - 1) // n_chunks
+    for c in numba.prange(n_chunks):
+        for i in range(c * step, min((c + 1) * step, codes.size)):
+            partial[c, codes[i]] += weights[i]
+    return partial.sum(axis=0)
+
+def top_names(codes, weights, names, k=10):
+    """Top-k names by summed weight over integer name codes."""
+    with _KERNEL_LOCK:
+        n_chunks = min(numba.get_num_threads(), MAX_KERNEL_CHUNKS)
+        sums = sum_by_name(codes, weights, len(names), n_chunks)
+    k = min(k, np.count_nonzero(sums))
+    top = np.argpartition(-sums, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    top = top[np.argsort(-sums[top], kind='stable')]
+    return pd.DataFrame({'name': np.asarray(names)[top], 'count': sums[top]})
+
+@st.cache_resource
+def count_weights(_data):
+    """Per-row counts for each summary gender option; the other sex's rows are zeroed."""
+    counts = _data['count'].to_numpy()
+    counts_f = np.where((_data['sex'] == 'F').to_numpy(), counts, 0).astype(np.int32)
+    return {'Both': counts, 'F': counts_f, 'M': counts - counts_f}
+
+@st.cache_resource
+def name_index(_data):
+    """Map each lowercased name to the (ascending) row positions where it appears."""
+    lower_codes, lower_names = pd.factorize(_data['name'].cat.categories.str.lower())
+    row_keys = lower_codes[_data['name'].cat.codes.to_numpy()]
+    order = np.argsort(row_keys, kind='stable')
+    bounds = np.searchsorted(row_keys[order], np.arange(len(lower_names) + 1))
+    return {name: order[bounds[i]:bounds[i + 1]] for i, name in enumerate(lower_names)}
+
+@st.cache_data(ttl=None, max_entries=256)
+def top10_summary(y0, y1, gender):
+    """Total births and top-10 names for a year range and gender option."""
+    data = load_name_data()
+    lo, hi = year_bounds(data, y0, y1)
+    name_codes = data['name'].cat.codes.to_numpy()[lo:hi]
+    name_counts = count_weights(data)[gender][lo:hi]
+    total_births = int(name_counts.sum(dtype=np.int64))
+    return total_births, top_names(name_codes, name_counts, data['name'].cat.categories)